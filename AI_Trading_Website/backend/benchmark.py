@@ -0,0 +1,359 @@
+#!/usr/bin/env python
+"""Benchmark suite for the trading strategies and the /ws serving path.
+
+Examples:
+    python benchmark.py --output baseline.json
+    python benchmark.py --suite strategies --sizes 100,1000 --output current.json
+    python benchmark.py --baseline baseline.json --output current.json
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import sys
+import threading
+import time
+import timeit
+from datetime import datetime
+from types import SimpleNamespace
+
+# Make the backend modules importable the same way main.py imports them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import strategies
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_CLIENTS = [1, 10, 50]
+SERVER_STARTUP_TIMEOUT = 10.0
+DEFAULT_NOISE_FLOOR = 5e-7
+# The analyze_* functions index up to three candles back
+MIN_HISTORY_SIZE = 3
+# Arguments that change what each suite measures, so results are only comparable when they match
+WORKLOAD_ARGS = {
+    'strategies': ('repeat',),
+    'ws': ('ticks', 'upstream_latency'),
+}
+
+
+def generate_klines(count, seed=42):
+    """Generate a reproducible random walk of OHLCV candles"""
+    rng = random.Random(seed)
+    klines = []
+    price = 50000.0
+    for _ in range(count):
+        open_price = price
+        close_price = open_price * (1 + rng.gauss(0, 0.004))
+        high = max(open_price, close_price) * (1 + abs(rng.gauss(0, 0.002)))
+        low = min(open_price, close_price) * (1 - abs(rng.gauss(0, 0.002)))
+        klines.append({
+            'open': open_price,
+            'high': high,
+            'low': low,
+            'close': close_price,
+            'volume': rng.uniform(1.0, 100.0),
+        })
+        price = close_price
+    return klines
+
+
+def strategy_cases(klines):
+    """Build (function name, callable) pairs covering every function in strategies.py"""
+    closes = [k['close'] for k in klines]
+    rsi = strategies.calculate_rsi(closes)
+    macd, signal, histogram = strategies.calculate_macd(closes)
+    upper_band, middle_band, lower_band = strategies.calculate_bollinger_bands(closes)
+    # Zones from every candle and a price far away from all of them, so the whole list is scanned
+    liquidity_zones = [k['high'] for k in klines] + [k['low'] for k in klines]
+    far_price = max(liquidity_zones) * 10
+    last_close = closes[-1]
+
+    return [
+        ('detect_fvg', lambda: strategies.detect_fvg(klines)),
+        ('check_liquidity_zone', lambda: strategies.check_liquidity_zone(far_price, liquidity_zones)),
+        ('calculate_rsi', lambda: strategies.calculate_rsi(closes)),
+        ('calculate_macd', lambda: strategies.calculate_macd(closes)),
+        ('calculate_bollinger_bands', lambda: strategies.calculate_bollinger_bands(closes)),
+        ('analyze_trade_signal[fvg_liquidity]', lambda: strategies.analyze_trade_signal(klines, 'fvg_liquidity')),
+        ('analyze_trade_signal[rsi_macd]', lambda: strategies.analyze_trade_signal(klines, 'rsi_macd')),
+        ('analyze_trade_signal[bollinger_breakout]', lambda: strategies.analyze_trade_signal(klines, 'bollinger_breakout')),
+        ('analyze_fvg_liquidity', lambda: strategies.analyze_fvg_liquidity(klines, rsi, macd, signal, histogram)),
+        ('analyze_rsi_macd', lambda: strategies.analyze_rsi_macd(rsi, macd, signal, histogram, last_close)),
+        ('analyze_bollinger_breakout', lambda: strategies.analyze_bollinger_breakout(closes, upper_band, middle_band, lower_band, rsi)),
+        ('calculate_stop_loss', lambda: strategies.calculate_stop_loss(klines, 'BUY', last_close)),
+        ('calculate_take_profit', lambda: strategies.calculate_take_profit(klines, 'BUY', last_close)),
+    ]
+
+
+def time_callable(func, repeat):
+    """Return per-call timings in seconds, calibrating the loop count like `python -m timeit`"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+
+def run_strategy_benchmarks(sizes, repeat):
+    results = {}
+    for size in sizes:
+        klines = generate_klines(size)
+        for name, func in strategy_cases(klines):
+            timings = time_callable(func, repeat)
+            median = statistics.median(timings)
+            results[f"strategies/{name}/n={size}"] = {
+                'value': median,
+                'unit': 's',
+                'better': 'lower',
+                'min': min(timings),
+                'max': max(timings),
+                'repeat': repeat,
+            }
+            print(f"  {name:<42} n={size:<9} {median * 1e3:12.4f} ms", file=sys.stderr)
+    return results
+
+
+class FakeResponse:
+    """Stand-in for a requests.Response from the Binance ticker endpoint"""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+def make_mock_upstreams(latency):
+    """Build blocking fakes for requests and the OpenAI client, each taking `latency` seconds"""
+
+    def get(url, timeout=None):
+        time.sleep(latency)
+        return FakeResponse({'price': '50000.0'})
+
+    def create(model, messages, temperature=None):
+        time.sleep(latency)
+        if 'news' in messages[0]['content']:
+            content = json.dumps(["Mock headline one (Bench)", "Mock headline two (Bench)", "Mock headline three (Bench)"])
+        else:
+            content = json.dumps({'signal': 'BUY', 'confidence': 0.8})
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    fake_requests = SimpleNamespace(get=get)
+    fake_openai_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return fake_requests, fake_openai_client
+
+
+def find_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_ws_client(url, ticks):
+    """Connect one client and return (time to first tick, gaps between later ticks)"""
+    import websockets
+
+    start = time.perf_counter()
+    async with websockets.connect(url) as ws:
+        arrivals = []
+        for _ in range(ticks):
+            json.loads(await ws.recv())
+            arrivals.append(time.perf_counter())
+    first_tick = arrivals[0] - start
+    gaps = [arrivals[i] - arrivals[i - 1] for i in range(1, len(arrivals))]
+    return first_tick, gaps
+
+
+async def run_ws_load(url, clients, ticks):
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(*(run_ws_client(url, ticks) for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    first_ticks = [first for first, _ in outcomes]
+    gaps = [gap for _, client_gaps in outcomes for gap in client_gaps]
+    return elapsed, first_ticks, gaps
+
+
+def run_ws_benchmarks(client_counts, ticks, upstream_latency):
+    import uvicorn
+    import main
+
+    fake_requests, fake_openai_client = make_mock_upstreams(upstream_latency)
+    overrides = {
+        'requests': fake_requests,
+        'openai_client': fake_openai_client,
+        'OPENAI_AVAILABLE': True,
+        'USE_MOCK_DATA': False,
+        'WS_UPDATE_INTERVAL': 0,
+    }
+    originals = {name: getattr(main, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(main, name, value)
+
+    port = find_free_port()
+    server = uvicorn.Server(uvicorn.Config(main.app, host='127.0.0.1', port=port, log_level='error'))
+    thread = threading.Thread(target=server.run, daemon=True)
+
+    results = {}
+    # main.py prints client disconnects to stdout, which would corrupt the JSON report
+    with contextlib.redirect_stdout(sys.stderr):
+        thread.start()
+        try:
+            deadline = time.monotonic() + SERVER_STARTUP_TIMEOUT
+            while not server.started:
+                if not thread.is_alive():
+                    raise RuntimeError(f"Benchmark server exited before it started listening on port {port}")
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Benchmark server did not start within {SERVER_STARTUP_TIMEOUT:.0f}s on port {port}")
+                time.sleep(0.05)
+
+            url = f"ws://127.0.0.1:{port}/ws?symbol=BTCUSDT&strategy=ai_analysis"
+            for clients in client_counts:
+                elapsed, first_ticks, gaps = asyncio.run(run_ws_load(url, clients, ticks))
+                throughput = clients * ticks / elapsed
+                prefix = f"ws/clients={clients}"
+                results[f"{prefix}/throughput"] = {'value': throughput, 'unit': 'ticks/s', 'better': 'higher'}
+                results[f"{prefix}/first_tick_p50"] = {'value': statistics.median(first_ticks), 'unit': 's', 'better': 'lower'}
+                if gaps:
+                    results[f"{prefix}/tick_latency_p50"] = {'value': percentile(gaps, 50), 'unit': 's', 'better': 'lower'}
+                    results[f"{prefix}/tick_latency_p99"] = {'value': percentile(gaps, 99), 'unit': 's', 'better': 'lower'}
+                    p50 = results[f"{prefix}/tick_latency_p50"]['value']
+                else:
+                    p50 = float('nan')
+                print(f"  clients={clients:<5} {throughput:10.1f} ticks/s   tick p50 {p50 * 1e3:9.3f} ms", file=sys.stderr)
+        finally:
+            server.should_exit = True
+            thread.join(timeout=10)
+            for name, value in originals.items():
+                setattr(main, name, value)
+
+    return results
+
+
+def workload_mismatches(current_args, baseline_args):
+    """Return (name, baseline value, current value) for workload arguments that differ from the baseline"""
+    suites = WORKLOAD_ARGS if current_args['suite'] == 'all' else [current_args['suite']]
+    mismatches = []
+    for suite in suites:
+        for name in WORKLOAD_ARGS[suite]:
+            if name in baseline_args and baseline_args[name] != current_args[name]:
+                mismatches.append((name, baseline_args[name], current_args[name]))
+    return mismatches
+
+
+def compare_results(current, baseline, tolerance, noise_floor=DEFAULT_NOISE_FLOOR):
+    """Print a comparison table and return the names of metrics that regressed
+
+    Timings that carry a `min` are compared on it, since the fastest run is the least disturbed by
+    other load. Changes in seconds smaller than `noise_floor` never count as regressions.
+    """
+    regressions = []
+    print(f"\n===== Comparison against baseline (tolerance {tolerance:.0%}, "
+          f"noise floor {noise_floor * 1e9:.0f} ns) =====\n", file=sys.stderr)
+    for name in sorted(set(current) & set(baseline)):
+        key = 'min' if 'min' in current[name] and 'min' in baseline[name] else 'value'
+        new = current[name][key]
+        old = baseline[name][key]
+        if not old:
+            continue
+        change = (new - old) / old
+        if current[name]['better'] == 'higher':
+            regressed = change < -tolerance
+        else:
+            regressed = change > tolerance
+        if current[name]['unit'] == 's' and abs(new - old) < noise_floor:
+            regressed = False
+        status = "REGRESSION" if regressed else "ok"
+        print(f"{status:<10} {name:<60} {old:14.6g} -> {new:14.6g} ({change:+.1%})", file=sys.stderr)
+        if regressed:
+            regressions.append(name)
+
+    missing = sorted(set(baseline) - set(current))
+    if missing:
+        print(f"\n{len(missing)} baseline metric(s) were not measured in this run", file=sys.stderr)
+    return regressions
+
+
+def parse_int_list(value):
+    return [int(item) for item in value.split(',') if item]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the trading strategies and the /ws endpoint")
+    parser.add_argument('--suite', choices=['all', 'strategies', 'ws'], default='all')
+    parser.add_argument('--sizes', type=parse_int_list, default=DEFAULT_SIZES,
+                        help="Comma separated candle history sizes for the strategy benchmarks")
+    parser.add_argument('--repeat', type=int, default=5, help="Timing repeats per strategy benchmark")
+    parser.add_argument('--clients', type=parse_int_list, default=DEFAULT_CLIENTS,
+                        help="Comma separated concurrent client counts for the /ws benchmark")
+    parser.add_argument('--ticks', type=int, default=20, help="Ticks received by each /ws client")
+    parser.add_argument('--upstream-latency', type=float, default=0.005,
+                        help="Seconds each mocked Binance/OpenAI call blocks for")
+    parser.add_argument('--output', help="Write results as JSON to this file (default: stdout)")
+    parser.add_argument('--baseline', help="Compare against a previous JSON result and fail on regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Allowed relative slowdown before a metric counts as a regression")
+    parser.add_argument('--noise-floor', type=float, default=DEFAULT_NOISE_FLOOR,
+                        help="Timing changes below this many seconds are never counted as regressions")
+    args = parser.parse_args()
+    if min(args.sizes, default=MIN_HISTORY_SIZE) < MIN_HISTORY_SIZE:
+        parser.error(f"--sizes must all be at least {MIN_HISTORY_SIZE} candles")
+    if min(args.clients, default=1) < 1 or args.ticks < 1:
+        parser.error("--clients and --ticks must be at least 1")
+    run_args = {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')}
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        mismatches = workload_mismatches(run_args, baseline.get('meta', {}).get('args', {}))
+        if mismatches:
+            details = ", ".join(f"--{name.replace('_', '-')} {old} (baseline) vs {new}" for name, old, new in mismatches)
+            parser.error(f"workload differs from the baseline, results are not comparable: {details}")
+
+    results = {}
+    if args.suite in ('all', 'strategies'):
+        print("\n===== Strategy benchmarks =====\n", file=sys.stderr)
+        results.update(run_strategy_benchmarks(args.sizes, args.repeat))
+    if args.suite in ('all', 'ws'):
+        print("\n===== WebSocket benchmarks =====\n", file=sys.stderr)
+        results.update(run_ws_benchmarks(args.clients, args.ticks, args.upstream_latency))
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'args': run_args,
+        },
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if baseline is not None:
+        regressions = compare_results(results, baseline['results'], args.tolerance, args.noise_floor)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) found", file=sys.stderr)
+            sys.exit(1)
+        print("\nNo regressions found", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
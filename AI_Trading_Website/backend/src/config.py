@@ -15,4 +15,7 @@ OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
 FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:3000')
 
 # Mock data settings
-USE_MOCK_DATA = os.getenv('USE_MOCK_DATA', 'true').lower() == 'true'
\ No newline at end of file
+USE_MOCK_DATA = os.getenv('USE_MOCK_DATA', 'true').lower() == 'true'
+
+# WebSocket settings
+WS_UPDATE_INTERVAL = float(os.getenv('WS_UPDATE_INTERVAL', 5))
\ No newline at end of file
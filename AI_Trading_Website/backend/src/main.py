@@ -85,7 +85,7 @@ async def websocket_endpoint(websocket: WebSocket):
             }
             
             await websocket.send_json(data)
-            await asyncio.sleep(5)  # Update every 5 seconds
+            await asyncio.sleep(WS_UPDATE_INTERVAL)  # Update every 5 seconds by default
             
     except WebSocketDisconnect:
         print(f"Client disconnected")
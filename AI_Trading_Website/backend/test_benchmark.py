@@ -0,0 +1,50 @@
+from benchmark import compare_results, percentile, workload_mismatches
+
+
+def metric(value, better='lower', unit='s', **extra):
+    return {'value': value, 'unit': unit, 'better': better, **extra}
+
+
+def test_compare_flags_slower_lower_is_better_metrics():
+    baseline = {'slow': metric(1.0), 'same': metric(1.0), 'faster': metric(1.0)}
+    current = {'slow': metric(1.5), 'same': metric(1.1), 'faster': metric(0.5)}
+    assert compare_results(current, baseline, tolerance=0.25, noise_floor=0) == ['slow']
+
+
+def test_compare_flags_drops_in_higher_is_better_metrics():
+    baseline = {'drop': metric(100.0, 'higher', 'ticks/s'), 'gain': metric(100.0, 'higher', 'ticks/s')}
+    current = {'drop': metric(50.0, 'higher', 'ticks/s'), 'gain': metric(200.0, 'higher', 'ticks/s')}
+    assert compare_results(current, baseline, tolerance=0.25, noise_floor=0) == ['drop']
+
+
+def test_compare_skips_zero_baseline_and_unmatched_metrics():
+    baseline = {'zero': metric(0.0), 'only_in_baseline': metric(1.0)}
+    current = {'zero': metric(5.0), 'only_in_current': metric(5.0)}
+    assert compare_results(current, baseline, tolerance=0.25, noise_floor=0) == []
+
+
+def test_compare_ignores_timing_changes_below_noise_floor():
+    baseline = {'tiny': metric(4e-7), 'large': metric(1e-3)}
+    current = {'tiny': metric(8e-7), 'large': metric(2e-3)}
+    assert compare_results(current, baseline, tolerance=0.25, noise_floor=5e-7) == ['large']
+
+
+def test_compare_uses_min_when_both_sides_have_it():
+    baseline = {'timing': metric(1.0, min=1.0)}
+    current = {'timing': metric(5.0, min=1.1)}
+    assert compare_results(current, baseline, tolerance=0.25, noise_floor=0) == []
+
+
+def test_workload_mismatches_only_checks_suites_that_ran():
+    baseline_args = {'repeat': 5, 'ticks': 20, 'upstream_latency': 0.005}
+    current_args = {'suite': 'strategies', 'repeat': 5, 'ticks': 10, 'upstream_latency': 0.05}
+    assert workload_mismatches(current_args, baseline_args) == []
+    current_args['suite'] = 'all'
+    assert workload_mismatches(current_args, baseline_args) == [('ticks', 20, 10), ('upstream_latency', 0.005, 0.05)]
+
+
+def test_percentile():
+    values = [5, 1, 4, 2, 3]
+    assert percentile(values, 0) == 1
+    assert percentile(values, 50) == 3
+    assert percentile(values, 100) == 5